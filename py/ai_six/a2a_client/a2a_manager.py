@@ -1,5 +1,6 @@
 """A2A Manager - Singleton for managing A2A infrastructure."""
 
+import asyncio
 import atexit
 import logging
 import threading
@@ -119,8 +120,6 @@ class A2AManager:
     @classmethod
     def cleanup(cls):
         """Cleanup all A2A resources. Called automatically on exit."""
-        import asyncio
-        
         with cls._lock:
             if not cls._initialized:
                 return
@@ -1,10 +1,14 @@
+import hashlib
 import json
 import os.path
+from collections import OrderedDict
 from pathlib import Path
-from typing import Callable, Optional, Dict, Any, List, Tuple, Set
+from typing import Callable, Collection, Optional, Dict, Any, List, Mapping, Tuple, Set
 import importlib.util
 import inspect
+import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict
 
 from ai_six.agent.config import Config
@@ -21,6 +25,7 @@ from ai_six.agent.session import Session
 from ai_six.agent.session_manager import SessionManager
 from ai_six.agent import tool_manager
 from ai_six.agent.config import ToolConfig
+from ai_six.tools.base.mcp_tool import MCPTool
 from ai_six.tools.memory.list_sessions import ListSessions
 from ai_six.tools.memory.load_session import LoadSession
 from ai_six.tools.memory.get_session_id import GetSessionId
@@ -48,6 +53,17 @@ class Agent:
     # Class-level set to track all agent names for uniqueness
     _all_agent_names: Set[str] = set()
 
+    # Class-level cache of the LLM provider classes found in each providers directory,
+    # so the provider modules are only imported once per process
+    _llm_provider_classes: Dict[Path, List[Tuple[str, type]]] = {}
+
+    # Class-level LRU cache of LLM providers keyed by provider class and a digest of its
+    # configuration (which may hold secrets). Agents with the same provider config
+    # (e.g. one per Slack channel) share the provider and therefore its HTTP client.
+    _LLM_PROVIDER_CACHE_MAX_SIZE = 32
+    _llm_provider_cache: "OrderedDict[Tuple[type, str], LLMProvider]" = OrderedDict()
+    _llm_provider_lock = threading.Lock()
+
     def __init__(self, config: Config) -> None:
         self.default_model_id = config.default_model_id
         self.system_prompt = config.system_prompt
@@ -107,6 +123,13 @@ class Agent:
             self.session.session_id, 
             inject_system_message
         )
+        self.tools_by_server = tool_manager.group_tools_by_server(self.tool_dict)
+
+        # Maximum number of tool calls from a single LLM response run concurrently
+        # (see the tool_concurrency property). The pool is created on first use.
+        self._tool_concurrency = 1
+        self._tool_pool: Optional[ThreadPoolExecutor] = None
+        self._tool_pool_lock = threading.Lock()
 
         # Session-related attributes
         self.checkpoint_interval = config.checkpoint_interval
@@ -120,10 +143,14 @@ class Agent:
 
         # Load previous session if session_id is provided and exists
         if config.session_id:
-            available_sessions = self.session_manager.list_sessions()
-            if config.session_id in available_sessions:
-                self.session = Session(config.memory_dir)  # Create a new session object
-                self.session.load(config.session_id)  # Load from disk
+            if self.session_manager.session_exists(config.session_id):
+                session = Session(config.memory_dir)  # Create a new session object
+                try:
+                    session.load(config.session_id)  # Load from disk
+                    self.session = session
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    # Not a valid session file (e.g. a detailed log); keep the new session
+                    pass
 
     @classmethod
     def from_config_file(cls, config_file: str) -> "Agent":
@@ -147,8 +174,54 @@ class Agent:
         llm_providers_dir: str, provider_config: Dict[str, dict[str, dict]]
     ) -> List[LLMProvider]:
         providers = []
+        for name, clazz in Agent._load_llm_provider_classes(Path(llm_providers_dir).resolve()):
+            try:
+                # Get configuration for this provider type
+                provider_type = name.lower().replace("provider", "")
+                conf = provider_config.get(provider_type, {})
+                providers.append(Agent._get_llm_provider(clazz, conf))
+            except Exception as e:
+                continue
+
+        return providers
 
-        base_path = Path(llm_providers_dir).resolve()
+    @staticmethod
+    def _get_llm_provider(clazz: type, conf: Mapping[str, Any]) -> LLMProvider:
+        """Return the cached provider for this class and configuration, creating it if needed."""
+        conf_digest = hashlib.sha256(
+            json.dumps(dict(conf), sort_keys=True, default=str).encode()
+        ).hexdigest()
+        cache_key = (clazz, conf_digest)
+
+        with Agent._llm_provider_lock:
+            provider = Agent._llm_provider_cache.get(cache_key)
+            if provider is not None:
+                Agent._llm_provider_cache.move_to_end(cache_key)
+                return provider
+
+        # Instantiate provider with configuration
+        provider = clazz(**conf)
+
+        with Agent._llm_provider_lock:
+            # Another thread may have created it in the meantime; keep the first one
+            provider = Agent._llm_provider_cache.setdefault(cache_key, provider)
+            Agent._llm_provider_cache.move_to_end(cache_key)
+            while len(Agent._llm_provider_cache) > Agent._LLM_PROVIDER_CACHE_MAX_SIZE:
+                Agent._llm_provider_cache.popitem(last=False)
+
+        return provider
+
+    @staticmethod
+    def _load_llm_provider_classes(base_path: Path) -> List[Tuple[str, type]]:
+        """Import the provider modules in a directory and return their LLMProvider subclasses.
+
+        The result is cached per directory.
+        """
+        classes = Agent._llm_provider_classes.get(base_path)
+        if classes is not None:
+            return classes
+
+        classes = []
 
         # Determine if we're in development mode (py/ai_six) or installed package (ai_six)
         # Check if path contains 'py/ai_six' or just 'ai_six'
@@ -207,23 +280,15 @@ class Agent:
                         issubclass(clazz, LLMProvider)
                         and clazz.__module__ != LLMProvider.__module__
                     ):
-                        try:
-                            # Get configuration for this provider type
-                            provider_type = name.lower().replace("provider", "")
-                            conf = provider_config.get(provider_type, {})
-
-                            # Instantiate provider with configuration
-                            provider = clazz(**conf)
-                            providers.append(provider)
-                        except Exception as e:
-                            continue
+                        classes.append((name, clazz))
 
             except Exception as e:
                 # Handle any errors that occur during module loading
                 print(f"Error loading module {module_name}: {e}")
                 continue
 
-        return providers
+        Agent._llm_provider_classes[base_path] = classes
+        return classes
 
     def _create_new_session(self, memory_dir: str) -> Session:
         """Create a new session with optional system prompt."""
@@ -247,6 +312,59 @@ class Agent:
         self.tool_dict[get_session_id_tool.name] = get_session_id_tool
         self.tool_dict[delete_session_tool.name] = delete_session_tool
 
+        # Memory tools change the agent's session, so they never run on the tool pool
+        self._memory_tool_names = {
+            list_sessions_tool.name,
+            load_session_tool.name,
+            get_session_id_tool.name,
+            delete_session_tool.name,
+        }
+
+    @property
+    def tool_concurrency(self) -> int:
+        """Maximum number of tool calls from a single LLM response that run concurrently.
+
+        1 (the default) runs them one after another on the calling thread.
+        """
+        return self._tool_concurrency
+
+    @tool_concurrency.setter
+    def tool_concurrency(self, value: int) -> None:
+        with self._tool_pool_lock:
+            self._tool_concurrency = value
+            pool, self._tool_pool = self._tool_pool, None
+        # The next batch of tool calls creates a pool of the new size
+        if pool is not None:
+            pool.shutdown(wait=False)
+
+    def _get_tool_pool(self) -> ThreadPoolExecutor:
+        """Return the tool thread pool, creating it if needed."""
+        with self._tool_pool_lock:
+            if self._tool_pool is None:
+                self._tool_pool = ThreadPoolExecutor(
+                    max_workers=self._tool_concurrency, thread_name_prefix="ai6-tool"
+                )
+            return self._tool_pool
+
+    def _shutdown_tool_pool(self, wait: bool = False) -> None:
+        """Shut down the tool thread pool if there is one."""
+        with self._tool_pool_lock:
+            pool, self._tool_pool = self._tool_pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait)
+
+    def close(self) -> None:
+        """Release the agent's tool thread pool. The agent can still be used afterwards."""
+        self._shutdown_tool_pool(wait=True)
+
+    def _runs_on_tool_pool(self, tool: Any) -> bool:
+        """Whether a tool may run on the tool pool rather than the calling thread.
+
+        Agent tools (which drive a sub-agent and share a tool call callback) and
+        memory tools (which change this agent's session) always run on the calling thread.
+        """
+        return not hasattr(tool, "set_tool_call_callback") and tool.name not in self._memory_tool_names
+
 
     def _execute_tools(
         self,
@@ -288,56 +406,105 @@ class Agent:
                 )
             )
 
-        # Execute tools and create tool messages
-        tool_messages = []
-        for tool_call in tool_calls:
-            tool = self.tool_dict.get(tool_call.name)
-            if tool is None:
-                raise RuntimeError(f"Unknown tool: {tool_call.name}")
-
-            try:
-                kwargs = json.loads(tool_call.arguments)
-            except json.JSONDecodeError as e:
-                raise RuntimeError(
-                    f"Invalid arguments JSON for tool '{tool_call.name}'"
+        # Execute tools and create tool messages, keeping the order of the tool calls
+        tool_call_ids = [id_mapping.get(tool_call.id, tool_call.id) for tool_call in tool_calls]
+
+        # Calls to the same tool instance run one after another in a single pool task,
+        # since tools may hold state. All MCP tools share one event loop, so they form a
+        # single group too. Calls that can't use the pool run on this thread.
+        pool_groups: Dict[Any, List[int]] = {}
+        local_indices: List[int] = []
+        if self._tool_concurrency > 1:
+            for i, tool_call in enumerate(tool_calls):
+                tool = self.tool_dict.get(tool_call.name)
+                if tool is not None and self._runs_on_tool_pool(tool):
+                    group_key = MCPTool if isinstance(tool, MCPTool) else id(tool)
+                    pool_groups.setdefault(group_key, []).append(i)
+                else:
+                    local_indices.append(i)
+
+        if len(pool_groups) + bool(local_indices) <= 1:
+            tool_messages = [
+                self._run_tool_call(tool_call, tool_call_id, on_tool_call_func)
+                for tool_call, tool_call_id in zip(tool_calls, tool_call_ids)
+            ]
+        else:
+            pool = self._get_tool_pool()
+            futures = [
+                pool.submit(
+                    self._run_tool_call_group, indices, tool_calls, tool_call_ids, on_tool_call_func
                 )
+                for indices in pool_groups.values()
+            ]
+            results = self._run_tool_call_group(
+                local_indices, tool_calls, tool_call_ids, on_tool_call_func
+            )
+            for future in futures:
+                results.extend(future.result())
+            tool_messages = [None] * len(tool_calls)
+            for i, tool_message in results:
+                tool_messages[i] = tool_message
 
-            # Get the potentially updated tool call ID
-            tool_call_id = tool_call.id
-            if tool_call.id in id_mapping:
-                tool_call_id = id_mapping[tool_call.id]
+        return updated_tool_calls, tool_messages
 
-            try:
-                # Set callback for AgentTools if available
-                if (
-                    hasattr(tool, "set_tool_call_callback")
-                    and on_tool_call_func is not None
-                ):
-                    tool.set_tool_call_callback(on_tool_call_func)
-
-                # Execute the tool
-                tool_result = tool.run(**kwargs)
-
-                # Call the callback if provided
-                if on_tool_call_func is not None:
-                    on_tool_call_func(tool_call.name, kwargs, str(tool_result))
-
-                # Create the tool message
-                tool_message = ToolMessage(
-                    content=str(tool_result),
-                    name=tool_call.name,
-                    tool_call_id=tool_call_id,
-                )
-            except Exception as e:
-                tool_message = ToolMessage(
-                    content=str(e),
-                    name=tool_call.name,
-                    tool_call_id=tool_call_id,
-                )
+    def _run_tool_call_group(
+        self,
+        indices: List[int],
+        tool_calls: List[ToolCall],
+        tool_call_ids: List[str],
+        on_tool_call_func: Optional[Callable[[str, Dict[str, Any], str], None]],
+    ) -> List[Tuple[int, ToolMessage]]:
+        """Run the tool calls at the given indices one after another."""
+        return [
+            (i, self._run_tool_call(tool_calls[i], tool_call_ids[i], on_tool_call_func))
+            for i in indices
+        ]
+
+    def _run_tool_call(
+        self,
+        tool_call: ToolCall,
+        tool_call_id: str,
+        on_tool_call_func: Optional[Callable[[str, Dict[str, Any], str], None]],
+    ) -> ToolMessage:
+        """Run a single tool call and return its tool message."""
+        tool = self.tool_dict.get(tool_call.name)
+        if tool is None:
+            raise RuntimeError(f"Unknown tool: {tool_call.name}")
 
-            tool_messages.append(tool_message)
+        try:
+            kwargs = json.loads(tool_call.arguments)
+        except json.JSONDecodeError as e:
+            raise RuntimeError(
+                f"Invalid arguments JSON for tool '{tool_call.name}'"
+            )
 
-        return updated_tool_calls, tool_messages
+        try:
+            # Set callback for AgentTools if available
+            if (
+                hasattr(tool, "set_tool_call_callback")
+                and on_tool_call_func is not None
+            ):
+                tool.set_tool_call_callback(on_tool_call_func)
+
+            # Execute the tool
+            tool_result = tool.run(**kwargs)
+
+            # Call the callback if provided
+            if on_tool_call_func is not None:
+                on_tool_call_func(tool_call.name, kwargs, str(tool_result))
+
+            # Create the tool message
+            return ToolMessage(
+                content=str(tool_result),
+                name=tool_call.name,
+                tool_call_id=tool_call_id,
+            )
+        except Exception as e:
+            return ToolMessage(
+                content=str(e),
+                name=tool_call.name,
+                tool_call_id=tool_call_id,
+            )
 
     def _checkpoint_if_needed(self) -> None:
         """Check if we need to save a checkpoint and do so if needed."""
@@ -398,6 +565,7 @@ class Agent:
 
         # Update session reference and ID
         self.session = new_session
+        self._shutdown_tool_pool()
         self.active_session_id = new_session.session_id
 
         # Save the new session immediately
@@ -441,18 +609,30 @@ class Agent:
         with open(log_filename, "w") as f:
             json.dump(detailed_log, f, indent=4)
 
+    def _get_available_tools(
+        self, available_tool_ids: Optional[Collection[str]]
+    ) -> Dict[str, Any]:
+        """Return the tools the LLM may use, or all tools if available_tool_ids is None."""
+        if available_tool_ids is None:
+            return self.tool_dict
+        return {k: v for k, v in self.tool_dict.items() if k in available_tool_ids}
+
     def _send(
         self,
         model_id: str,
         on_tool_call_func: Optional[Callable[[str, dict, str], None]],
+        available_tools: Optional[Dict[str, Any]] = None,
     ) -> str:
         llm_provider = self.model_provider_map.get(model_id)
         if llm_provider is None:
             raise RuntimeError(f"Unknown model ID: {model_id}")
 
+        if available_tools is None:
+            available_tools = self.tool_dict
+
         try:
             response = llm_provider.send(
-                self.session.messages, self.tool_dict, model_id
+                self.session.messages, available_tools, model_id
             )
         except Exception as e:
             raise RuntimeError(f"Error sending message to LLM: {e}")
@@ -476,7 +656,7 @@ class Agent:
                 self.session.add_message(tool_message)
 
             # Continue the session with another send
-            return self._send(model_id, on_tool_call_func)
+            return self._send(model_id, on_tool_call_func, available_tools)
 
         return response.content.strip()
 
@@ -507,13 +687,23 @@ class Agent:
         message: str,
         model_id: str | None = None,
         on_tool_call_func: Optional[Callable[[str, Dict[str, Any], str], None]] = None,
+        available_tool_ids: Optional[Collection[str]] = None,
     ) -> str:
-        """Send a single message and get a response."""
+        """Send a single message and get a response.
+
+        Args:
+            message: The message to send
+            model_id: The model ID to use (defaults to the agent's default model)
+            on_tool_call_func: Callback function for tool calls
+            available_tool_ids: If not None, only these tools are offered to the LLM
+        """
         user_message = UserMessage(content=message)
         self.session.add_message(user_message)
         self._checkpoint_if_needed()
         model_id = model_id or self.default_model_id
-        response = self._send(model_id, on_tool_call_func)
+        response = self._send(
+            model_id, on_tool_call_func, self._get_available_tools(available_tool_ids)
+        )
         assistant_message = AssistantMessage(content=response)
         self.session.add_message(assistant_message)
         self._checkpoint_if_needed()
@@ -526,7 +716,7 @@ class Agent:
         model_id: str,
         on_chunk_func: Callable[[str], None],
         on_tool_call_func: Optional[Callable[[str, Dict[str, Any], str], None]] = None,
-        available_tool_ids: Optional[List[str]] = None,
+        available_tool_ids: Optional[Collection[str]] = None,
     ) -> str:
         """
         Send a single message and stream the response.
@@ -536,6 +726,7 @@ class Agent:
             model_id: The model ID to use
             on_chunk_func: Callback function that receives each chunk of the response
             on_tool_call_func: Callback function for tool calls
+            available_tool_ids: If not None, only these tools are offered to the LLM
 
         Returns:
             The complete response
@@ -551,11 +742,7 @@ class Agent:
         final_content = ""
         tool_calls_handled = False
 
-        available_tools = self.tool_dict
-        if available_tool_ids is not None:
-            available_tools = {
-                k: v for k, v in self.tool_dict.items() if k in available_tool_ids
-            }
+        available_tools = self._get_available_tools(available_tool_ids)
         try:
             for response in llm_provider.stream(
                 self.session.messages, available_tools, model_id
@@ -585,7 +772,7 @@ class Agent:
                         self.session.add_message(tool_msg)
 
             if tool_calls_handled and message:
-                continuation = self._send(model_id, on_tool_call_func)
+                continuation = self._send(model_id, on_tool_call_func, available_tools)
                 if continuation:
                     if on_chunk_func:
                         on_chunk_func(f"{continuation}")
@@ -619,13 +806,21 @@ class Agent:
         Returns:
             True if the session was loaded successfully, False otherwise
         """
-        available_sessions = self.session_manager.list_sessions()
-        if session_id not in available_sessions:
+        # The active session is already in memory (and may be ahead of its file on disk)
+        if session_id == self.session.session_id:
+            return True
+
+        if not self.session_manager.session_exists(session_id):
             return False
 
-        # Load the session
-        self.session.load(session_id)
+        # Load the session. Other JSON files in the memory dir (e.g. detailed logs)
+        # exist but aren't sessions; Session.load leaves the session unchanged for them
+        try:
+            self.session.load(session_id)
+        except (json.JSONDecodeError, KeyError, TypeError):
+            return False
 
+        self._shutdown_tool_pool()
         return True
 
     def delete_session(self, session_id: str) -> bool:
@@ -1,13 +1,60 @@
 import json
 import os
+import re
 from dataclasses import dataclass, field
 from pathlib import Path
 from types import MappingProxyType
 from typing import Optional, Mapping, Any, List, Dict
 from ai_six.object_model import LLMProvider
+from ai_six.agent.file_cache import FileCache
 import yaml
 import toml
 
+# Use the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Matches ${VAR} references in config values
+_ENV_VAR_PATTERN = re.compile(r'\${([a-zA-Z0-9_]+)}')
+
+# Parsed config files keyed by absolute path. Entries are re-parsed when the
+# file changes (see FileCache).
+_CONFIG_CACHE_MAX_SIZE = 100
+
+
+def _parse_config_file(filename: str) -> Dict[str, Any]:
+    """Parse a JSON, YAML, or TOML file based on its extension."""
+    file_ext = Path(filename).suffix.lower()
+    with open(filename, 'r') as f:
+        if file_ext == '.json':
+            return json.load(f)
+        elif file_ext in ('.yaml', '.yml'):
+            return yaml.load(f, Loader=_YamlLoader)
+        elif file_ext == '.toml':
+            return toml.load(f)
+        else:
+            raise ValueError(f"Unsupported file format: {file_ext}. "
+                             "Supported formats are: .json, .yaml, .yml, .toml")
+
+
+_config_cache: FileCache[Dict[str, Any]] = FileCache(_parse_config_file, _CONFIG_CACHE_MAX_SIZE)
+
+
+def _load_config_data(filename: str) -> Dict[str, Any]:
+    """Return the raw data of a config file, re-parsing only if the file changed.
+
+    The returned data must not be mutated; Config.from_file only reads it while
+    _interpolate_env_vars builds fresh dicts and lists from it.
+    """
+    return _config_cache.get(os.path.abspath(filename))
+
+
+def _freeze_provider_config(provider_config: Mapping[str, Mapping]) -> Mapping[str, Mapping]:
+    """Return a read-only view of provider_config whose per-provider settings are read-only too."""
+    return MappingProxyType({name: MappingProxyType(dict(conf)) for name, conf in provider_config.items()})
+
 
 @dataclass
 class ToolConfig:
@@ -106,9 +153,7 @@ class Config:
         if isinstance(value, str):
             # Handle ${VAR} syntax
             if "${" in value and "}" in value:
-                import re
-                pattern = r'\${([a-zA-Z0-9_]+)}'
-                matches = re.findall(pattern, value)
+                matches = _ENV_VAR_PATTERN.findall(value)
 
                 for var_name in matches:
                     env_value = os.environ.get(var_name, '')
@@ -134,26 +179,18 @@ class Config:
         The file extension determines the format (.json, .yaml/.yml, or .toml).
         Required fields in the config file are: tools_dirs, mcp_tools_dirs, memory_dir, and default_model_id.
         Environment variables in the config are interpolated, supporting both ${VAR} and $VAR syntax.
+
+        Parsed file contents are cached per path and reused until the file's mtime,
+        size or inode changes. Interpolation runs on every call, so environment
+        changes are always picked up.
         """
         path = Path(filename)
 
         if not path.exists():
             raise FileNotFoundError(f"Configuration file not found: {filename}")
 
-        file_ext = path.suffix.lower()
-        config_data: Dict[str, Any] = {}
-
         # Load file content based on extension
-        with open(filename, 'r') as f:
-            if file_ext == '.json':
-                config_data = json.load(f)
-            elif file_ext in ('.yaml', '.yml'):
-                config_data = yaml.safe_load(f)
-            elif file_ext == '.toml':
-                config_data = toml.load(f)
-            else:
-                raise ValueError(f"Unsupported file format: {file_ext}. "
-                                 "Supported formats are: .json, .yaml, .yml, .toml")
+        config_data = _load_config_data(filename)
 
         # Interpolate environment variables in the loaded configuration
         config_data = Config._interpolate_env_vars(config_data)
@@ -195,7 +232,7 @@ class Config:
                     summary_threshold_ratio=agent_data.get('summary_threshold_ratio',
                                                            parent_config['summary_threshold_ratio']),
                     tool_config=MappingProxyType(agent_data.get('tool_config', parent_config['tool_config'])),
-                    provider_config=MappingProxyType(
+                    provider_config=_freeze_provider_config(
                         agent_data.get('provider_config', parent_config['provider_config'])),
                     remote_mcp_servers=agent_data.get('remote_mcp_servers', parent_config['remote_mcp_servers']),
                     a2a_servers=agent_data.get('a2a_servers', parent_config['a2a_servers']),
@@ -255,7 +292,7 @@ class Config:
             checkpoint_interval=checkpoint_interval,
             summary_threshold_ratio=summary_threshold_ratio,
             tool_config=MappingProxyType(tool_config),
-            provider_config=MappingProxyType(provider_config),
+            provider_config=_freeze_provider_config(provider_config),
             remote_mcp_servers=remote_mcp_servers,
             a2a_servers=a2a_servers,
             enabled_tools=enabled_tools,
@@ -266,6 +303,8 @@ class Config:
             description=description
         )
 
-        os.makedirs(conf.memory_dir, exist_ok=True)  # Validate the configuration
+        # A single stat in the common case where the directory already exists
+        if not os.path.isdir(conf.memory_dir):
+            os.makedirs(conf.memory_dir, exist_ok=True)  # Validate the configuration
         conf.invariant()
         return conf
@@ -0,0 +1,73 @@
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Generic, Iterable, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# (st_mtime_ns, st_size, st_ino) of a file; any edit or replacement changes it
+FileSignature = Tuple[int, int, int]
+
+
+class FileCache(Generic[T]):
+    """Thread-safe LRU cache of values parsed from files.
+
+    A file is only re-parsed when its (st_mtime_ns, st_size, st_ino) signature
+    changes. Cached values are shared between callers and must not be mutated.
+    """
+
+    def __init__(self, parse: Callable[[str], T], max_size: Optional[int] = None):
+        """Create an empty cache.
+
+        Args:
+            parse: Reads a file and returns the value to cache for it
+            max_size: Maximum number of cached files, or None for no limit
+        """
+        self.parse = parse
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, Tuple[FileSignature, T]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, filename: str) -> T:
+        """Return the parsed value of a file, parsing it only if it changed since it was cached."""
+        st = os.stat(filename)
+        signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+
+        with self._lock:
+            cached = self._entries.get(filename)
+            if cached is not None and cached[0] == signature:
+                self._entries.move_to_end(filename)
+                return cached[1]
+
+        value = self.parse(filename)
+
+        with self._lock:
+            self._entries[filename] = (signature, value)
+            self._entries.move_to_end(filename)
+            if self.max_size is not None:
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+
+        return value
+
+    def discard(self, filename: str) -> None:
+        """Forget the cached value of a file."""
+        with self._lock:
+            self._entries.pop(filename, None)
+
+    def retain(self, filenames: Iterable[str]) -> None:
+        """Forget every cached file except the given ones."""
+        keep = set(filenames)
+        with self._lock:
+            for filename in [f for f in self._entries if f not in keep]:
+                del self._entries[filename]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __contains__(self, filename: str) -> bool:
+        return filename in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,9 +1,32 @@
 import json
+import os
+import threading
 import uuid
 from dataclasses import asdict
+from typing import Optional
 
+from ai_six.agent.file_cache import FileCache
 from ai_six.object_model import Usage, Message, UserMessage, SystemMessage, AssistantMessage, ToolMessage, ToolCall
 
+def _parse_session_file(filename: str) -> dict:
+    with open(filename, 'r') as f:
+        return json.load(f)
+
+
+# Parsed session files keyed by filename. Saves change the file, so the next
+# load re-parses it (see FileCache).
+_SESSION_CACHE_MAX_SIZE = 32
+_session_cache: FileCache[dict] = FileCache(_parse_session_file, _SESSION_CACHE_MAX_SIZE)
+
+
+def _load_session_data(filename: str) -> dict:
+    """Return the raw data of a session file, re-parsing only if the file changed.
+
+    The returned data must not be mutated; Session.load builds fresh Message
+    objects from it.
+    """
+    return _session_cache.get(filename)
+
 
 def dict_to_message(message_dict: dict) -> Message:
     """Convert a dictionary to the appropriate Message object."""
@@ -30,14 +53,13 @@ def dict_to_message(message_dict: dict) -> Message:
                     arguments = tc.get('arguments', '')
                     # Convert dict arguments to JSON string if needed
                     if isinstance(arguments, dict):
-                        import json
                         arguments = json.dumps(arguments)
                 
                 tool_calls.append(ToolCall(
                     id=tc.get('id', ''),
                     name=name,
                     arguments=arguments,
-                    required=tc.get('required', [])
+                    required=list(tc.get('required', []))
                 ))
         usage = None
         if 'usage' in message_dict and message_dict['usage']:
@@ -69,10 +91,13 @@ class Session:
         self.messages: list[Message] = []
         self.usage = Usage(0, 0)
         self.memory_dir = memory_dir
+        self._messages_changed = threading.Condition()
 
     def add_message(self, message: Message):
         """Add a Message object to the session."""
-        self.messages.append(message)
+        with self._messages_changed:
+            self.messages.append(message)
+            self._messages_changed.notify_all()
         
         # Extract usage from AssistantMessage if present
         if hasattr(message, 'usage') and message.usage:
@@ -81,6 +106,22 @@ class Session:
                 self.usage.output_tokens + message.usage.output_tokens
             )
 
+    @property
+    def message_count(self) -> int:
+        """Number of messages in the session, safe to read while other threads add messages."""
+        return len(self.messages)
+
+    def wait_for_messages(self, count: int, timeout: Optional[float] = None) -> bool:
+        """Block until the session holds more than count messages.
+
+        Messages may be added from other threads (e.g. A2A interim updates).
+
+        Returns:
+            True if the session has more than count messages, False if timeout expired first
+        """
+        with self._messages_changed:
+            return self._messages_changed.wait_for(lambda: self.message_count > count, timeout)
+
     def save(self):
         # Convert Message objects to dictionaries for JSON serialization
         message_dicts = [asdict(msg) for msg in self.messages]
@@ -96,15 +137,23 @@ class Session:
             json.dump(d, f, indent=4)
 
     def load(self, session_id: str):
-        """Load session from disk, properly deserializing nested objects"""
+        """Load session from disk, properly deserializing nested objects.
+
+        Every field is read before any is assigned, so if the file isn't a valid
+        session (KeyError/TypeError) the current session is left unchanged.
+        """
         filename = f"{self.memory_dir}/{session_id}.json"
-        with open(filename, 'r') as f:
-            d = json.load(f)
-        self.session_id = d['session_id']
-        self.title = d['title']
-        
+        d = _load_session_data(filename)
+        loaded_session_id = d['session_id']
+        title = d['title']
+
         # Convert message dictionaries back to Message objects
-        self.messages = [dict_to_message(msg) for msg in d['messages']]
-        
+        messages = [dict_to_message(msg) for msg in d['messages']]
+
         # Deserialize usage directly to a Usage object
-        self.usage = Usage(d['usage']['input_tokens'], d['usage']['output_tokens'])
+        usage = Usage(d['usage']['input_tokens'], d['usage']['output_tokens'])
+
+        self.session_id = loaded_session_id
+        self.title = title
+        self.messages = messages
+        self.usage = usage
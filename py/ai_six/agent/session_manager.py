@@ -1,10 +1,15 @@
 import os
 import json
+from typing import Optional
+
+from ai_six.agent.file_cache import FileCache
 
 
 class SessionManager:
     def __init__(self, memory_dir: str):
         self.memory_dir = memory_dir
+        # Session titles keyed by filename (None for files that aren't sessions)
+        self._titles: FileCache[Optional[str]] = FileCache(self._read_title)
 
     def set_title(self, session_id: str, title: str):
         """Set the title of a session."""
@@ -19,41 +24,62 @@ class SessionManager:
             f.seek(0)
             json.dump(data, f, indent=4)
             f.truncate()
+        self._titles.discard(filename)
+
 
+    def session_exists(self, session_id: str) -> bool:
+        """Check whether a session file exists, without parsing every session in the directory."""
+        return os.path.isfile(os.path.join(self.memory_dir, f"{session_id}.json"))
 
     def list_sessions(self) -> dict[str, dict]:
         """List all sessions in the memory directory.
         
+        Session files are only re-parsed when their (st_mtime_ns, st_size, st_ino)
+        signature changes; files that aren't valid sessions are remembered too.
+
         Returns:
             A dictionary mapping session IDs to tuples of (name, filename)
         """
         sessions = {}
+        seen = []
         files = os.listdir(self.memory_dir)
         for f in files:
             if f.endswith('.json'):
                 try:
                     # Get session ID from the filename (dropping the .json extension)
                     session_id = os.path.basename(f).rsplit('.json', 1)[0]
-                    
-                    # Try to open and parse the file to verify it's valid JSON
                     full_path = os.path.join(self.memory_dir, f)
-                    with open(full_path, 'r') as file:
-                        try:
-                            # Attempt to parse the JSON
-                            session = json.loads(file.read())
-                            # Only add if we could parse the JSON
-                            sessions[session_id] = dict(title=session['title'], filename=full_path)
-                        except json.JSONDecodeError:
-                            # Skip files with invalid JSON
-                            print(f"Skipping file with invalid JSON: {f}")
-                            continue
+
+                    seen.append(full_path)
+                    title = self._titles.get(full_path)
+
+                    # Only add if the file is a valid session
+                    if title is not None:
+                        sessions[session_id] = dict(title=title, filename=full_path)
                 except Exception as e:
                     # Skip any files that cause other errors
                     print(f"Error parsing session file {f}: {e}")
                     continue
-                    
+
+        # Drop entries for files that no longer exist
+        self._titles.retain(seen)
         return sessions
 
+    @staticmethod
+    def _read_title(filename: str) -> Optional[str]:
+        """Read the title of a session file, or None if it isn't a valid session."""
+        with open(filename, 'r') as file:
+            try:
+                # Attempt to parse the JSON
+                session = json.loads(file.read())
+                return session['title']
+            except json.JSONDecodeError:
+                # Skip files with invalid JSON
+                print(f"Skipping file with invalid JSON: {os.path.basename(filename)}")
+            except (KeyError, TypeError) as e:
+                print(f"Error parsing session file {os.path.basename(filename)}: {e}")
+        return None
+
     def delete_session(self, session_id: str):
         """Delete a session by its ID."""
         sessions = self.list_sessions()
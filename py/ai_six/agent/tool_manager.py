@@ -1,4 +1,5 @@
 import asyncio
+import concurrent.futures
 import os
 from pathlib import Path
 import importlib.util
@@ -108,6 +109,27 @@ def configure_a2a_integration(tool_dict: dict[str, Tool], memory_dir: str, sessi
     return updated_tool_dict
 
 
+def group_tools_by_server(tool_dict: dict[str, Tool]) -> dict[str, list[str]]:
+    """Group the names of A2A and MCP tools by the server that provides them.
+
+    Args:
+        tool_dict: Dictionary of tools
+
+    Returns:
+        Dict mapping server name to the names of its tools, in tool_dict order
+    """
+    tools_by_server: dict[str, list[str]] = {}
+    for name, tool in tool_dict.items():
+        if isinstance(tool, A2ATool):
+            server = tool.server_name
+        elif isinstance(tool, MCPTool):
+            server = tool.server_id
+        else:
+            continue
+        tools_by_server.setdefault(server, []).append(name)
+    return tools_by_server
+
+
 def _filter_tools(tools: list[Tool], enabled_tools: Optional[list[str]], disabled_tools: Optional[list[str]]) -> list[Tool]:
     """Filter tools based on enabled/disabled configuration.
     
@@ -141,18 +163,26 @@ def _filter_tools(tools: list[Tool], enabled_tools: Optional[list[str]], disable
     return filtered_tools
 
 
-def _discover_native_tools(tools_dir: str, tool_config: Mapping[str, dict]) -> list[Tool]:
-    """Discover custom tools from the tools directory.
+# Tool classes found in each native tools directory, keyed by resolved path.
+# Scanning and importing the tool modules is done once per process; every agent
+# still gets its own tool instances.
+_native_tool_classes: dict[Path, list[type[Tool]]] = {}
+
+
+def _load_native_tool_classes(base_path: Path) -> list[type[Tool]]:
+    """Import the tool modules under a directory and return their Tool subclasses.
 
     Args:
-        tools_dir: Directory to search for tool files
-        tool_config: Configuration for tools
+        base_path: Resolved directory to search for tool files
 
     Returns:
-        List of Tool instances
+        List of Tool subclasses that can be instantiated without arguments
     """
-    tools: list[Tool] = []
-    base_path = Path(tools_dir).resolve()
+    classes = _native_tool_classes.get(base_path)
+    if classes is not None:
+        return classes
+
+    classes = []
     module_root_path = base_path.parents[2]  # Three levels up
 
     # Walk through all .py files in the directory (recursive)
@@ -184,25 +214,45 @@ def _discover_native_tools(tools_dir: str, tool_config: Mapping[str, dict]) -> l
                                           'A2ATaskListTool', 'A2ATaskCancelTool', 
                                           'A2ATaskMessageTool', 'A2ATaskStatusTool']:
                             continue
-                            
-                        # Check if tool is enabled in config
-                        tool_name = obj.__name__
-                        if tool_name in tool_config and not tool_config[tool_name].get('enabled', True):
-                            continue
-
-                        try:
-                            # Instantiate the tool
-                            tool_instance = obj()
-                            tools.append(tool_instance)
-                        except TypeError as e:
-                            # Skip tools that can't be instantiated without arguments
-                            print(f"Warning: Skipping {obj.__name__} - requires constructor arguments: {e}")
-                            continue
+                        classes.append(obj)
 
         except Exception as e:
             print(f"Warning: Failed to load tool from {file_path}: {e}")
             continue
 
+    _native_tool_classes[base_path] = classes
+    return classes
+
+
+def _discover_native_tools(tools_dir: str, tool_config: Mapping[str, dict]) -> list[Tool]:
+    """Discover custom tools from the tools directory.
+
+    Args:
+        tools_dir: Directory to search for tool files
+        tool_config: Configuration for tools
+
+    Returns:
+        List of Tool instances
+    """
+    tools: list[Tool] = []
+    for obj in _load_native_tool_classes(Path(tools_dir).resolve()):
+        # Check if tool is enabled in config
+        tool_name = obj.__name__
+        if tool_name in tool_config and not tool_config[tool_name].get('enabled', True):
+            continue
+
+        try:
+            # Instantiate the tool
+            tool_instance = obj()
+            tools.append(tool_instance)
+        except TypeError as e:
+            # Skip tools that can't be instantiated without arguments
+            print(f"Warning: Skipping {obj.__name__} - requires constructor arguments: {e}")
+            continue
+        except Exception as e:
+            print(f"Warning: Failed to load tool {obj.__name__}: {e}")
+            continue
+
     return tools
 
 
@@ -253,7 +303,6 @@ def _discover_local_mcp_tools(mcp_servers_dir: str) -> list[MCPTool]:
         try:
             loop = asyncio.get_running_loop()
             # We're in an async context, create a task
-            import concurrent.futures
             with concurrent.futures.ThreadPoolExecutor() as executor:
                 future = executor.submit(asyncio.run, discover_async())
                 return future.result()
@@ -341,7 +390,6 @@ def _get_remote_mcp_tools(remote_servers: list[dict]) -> list[Tool]:
         try:
             loop = asyncio.get_running_loop()
             # We're in an async context, create a task
-            import concurrent.futures
             with concurrent.futures.ThreadPoolExecutor() as executor:
                 future = executor.submit(asyncio.run, connect_async())
                 future.result()
@@ -422,7 +470,6 @@ def _get_a2a_tools(a2a_servers: list[dict]) -> list[Tool]:
         try:
             loop = asyncio.get_running_loop()
             # We're in an async context, create a task
-            import concurrent.futures
             with concurrent.futures.ThreadPoolExecutor() as executor:
                 future = executor.submit(asyncio.run, discover_async())
                 return future.result()
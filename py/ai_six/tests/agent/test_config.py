@@ -0,0 +1,85 @@
+import unittest
+import tempfile
+import os
+import shutil
+from unittest.mock import patch
+
+from ai_six.agent import config as config_module
+from ai_six.agent.config import Config
+
+
+class TestConfigFromFile(unittest.TestCase):
+    def setUp(self):
+        # Create a temporary directory holding the config file and the directories it references
+        self.test_dir = tempfile.mkdtemp()
+        self.memory_dir = os.path.join(self.test_dir, "memory")
+        self.tools_dir = os.path.join(self.test_dir, "tools")
+        self.mcp_tools_dir = os.path.join(self.test_dir, "mcp_tools")
+        os.makedirs(self.tools_dir)
+        os.makedirs(self.mcp_tools_dir)
+        self.config_file = os.path.join(self.test_dir, "config.yaml")
+        self.write_config("gpt-4o")
+        config_module._config_cache.clear()
+
+    def tearDown(self):
+        # Clean up the temporary directory
+        config_module._config_cache.clear()
+        shutil.rmtree(self.test_dir)
+
+    def write_config(self, model_id, system_prompt="${AI6_TEST_PROMPT}"):
+        with open(self.config_file, "w") as f:
+            f.write(f"default_model_id: {model_id}\n"
+                    f"tools_dirs:\n  - {self.tools_dir}\n"
+                    f"mcp_tools_dirs:\n  - {self.mcp_tools_dir}\n"
+                    f"memory_dir: {self.memory_dir}\n"
+                    f"system_prompt: \"{system_prompt}\"\n")
+
+    def test_unchanged_file_is_parsed_once(self):
+        with patch.object(config_module._config_cache, "parse",
+                          wraps=config_module._parse_config_file) as mock_parse:
+            first = Config.from_file(self.config_file)
+            second = Config.from_file(self.config_file)
+
+        self.assertEqual(mock_parse.call_count, 1)
+        self.assertEqual(first, second)
+        # Callers get their own containers, so mutating one config can't leak into the next
+        self.assertIsNot(first.tools_dirs, second.tools_dirs)
+
+    def test_mutating_a_config_does_not_affect_later_loads(self):
+        with patch.dict(os.environ, {"AI6_TEST_PROMPT": "original"}):
+            first = Config.from_file(self.config_file)
+            first.system_prompt = "You are a CLI program builder"
+            first.tools_dirs.append("/tmp/extra-tools")
+
+            second = Config.from_file(self.config_file)
+
+        self.assertEqual(second.system_prompt, "original")
+        self.assertEqual(second.tools_dirs, [self.tools_dir])
+
+    def test_modified_file_is_reparsed(self):
+        self.assertEqual(Config.from_file(self.config_file).default_model_id, "gpt-4o")
+
+        # Different size guarantees a new signature even on coarse mtime filesystems
+        self.write_config("gpt-4o-mini")
+
+        self.assertEqual(Config.from_file(self.config_file).default_model_id, "gpt-4o-mini")
+
+    def test_env_vars_are_interpolated_on_every_load(self):
+        with patch.dict(os.environ, {"AI6_TEST_PROMPT": "first"}):
+            self.assertEqual(Config.from_file(self.config_file).system_prompt, "first")
+        with patch.dict(os.environ, {"AI6_TEST_PROMPT": "second"}):
+            self.assertEqual(Config.from_file(self.config_file).system_prompt, "second")
+
+    def test_cache_is_bounded(self):
+        with patch.object(config_module._config_cache, "max_size", 2):
+            for i in range(3):
+                config_file = os.path.join(self.test_dir, f"config{i}.yaml")
+                shutil.copy(self.config_file, config_file)
+                Config.from_file(config_file)
+
+        self.assertEqual(len(config_module._config_cache), 2)
+        self.assertNotIn(os.path.join(self.test_dir, "config0.yaml"), config_module._config_cache)
+
+
+if __name__ == "__main__":
+    unittest.main()
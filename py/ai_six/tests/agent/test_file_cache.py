@@ -0,0 +1,69 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from ai_six.agent.file_cache import FileCache
+
+
+class TestFileCache(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.parsed = []
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def parse(self, filename):
+        self.parsed.append(filename)
+        with open(filename) as f:
+            return f.read()
+
+    def write_file(self, name, content):
+        filename = os.path.join(self.test_dir, name)
+        with open(filename, "w") as f:
+            f.write(content)
+        return filename
+
+    def test_file_is_parsed_again_only_when_it_changes(self):
+        cache = FileCache(self.parse)
+        filename = self.write_file("a.txt", "first")
+
+        self.assertEqual(cache.get(filename), "first")
+        self.assertEqual(cache.get(filename), "first")
+        self.assertEqual(len(self.parsed), 1)
+
+        # Different size guarantees a new signature even on coarse mtime filesystems
+        self.write_file("a.txt", "second!")
+        self.assertEqual(cache.get(filename), "second!")
+        self.assertEqual(len(self.parsed), 2)
+
+    def test_least_recently_used_file_is_evicted(self):
+        cache = FileCache(self.parse, max_size=2)
+        a, b, c = (self.write_file(name, name) for name in ("a", "b", "c"))
+
+        cache.get(a)
+        cache.get(b)
+        cache.get(a)
+        cache.get(c)
+
+        self.assertEqual(len(cache), 2)
+        self.assertIn(a, cache)
+        self.assertNotIn(b, cache)
+
+    def test_discard_and_retain(self):
+        cache = FileCache(self.parse)
+        a, b, c = (self.write_file(name, name) for name in ("a", "b", "c"))
+        for filename in (a, b, c):
+            cache.get(filename)
+
+        cache.discard(a)
+        cache.retain([b])
+
+        self.assertNotIn(a, cache)
+        self.assertIn(b, cache)
+        self.assertNotIn(c, cache)
+
+
+if __name__ == "__main__":
+    unittest.main()
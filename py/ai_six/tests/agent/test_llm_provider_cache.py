@@ -0,0 +1,122 @@
+import importlib.util
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from ai_six.agent.agent import Agent
+from ai_six.agent.config import Config
+from ai_six.object_model import LLMProvider
+
+
+class FakeProvider(LLMProvider):
+    """Provider that needs no network access."""
+
+    def __init__(self, api_key: str = ""):
+        self.api_key = api_key
+
+    def send(self, messages, tool_dict, model=None):
+        raise NotImplementedError
+
+    @property
+    def models(self) -> list[str]:
+        return ["fake-model"]
+
+
+FAKE_PROVIDER_MODULE = '''
+from ai_six.object_model import LLMProvider
+
+
+class FakeProvider(LLMProvider):
+    def send(self, messages, tool_dict, model=None):
+        raise NotImplementedError
+
+    @property
+    def models(self):
+        return ["fake-model"]
+'''
+
+
+class TestLLMProviderCache(unittest.TestCase):
+    def setUp(self):
+        self.memory_dir = tempfile.mkdtemp()
+        Agent._llm_provider_cache.clear()
+
+        self.patchers = [
+            patch.object(Agent, '_load_llm_provider_classes', return_value=[('FakeProvider', FakeProvider)]),
+            patch('ai_six.agent.tool_manager.get_tool_dict', side_effect=lambda *args, **kwargs: {}),
+            patch('ai_six.agent.agent.get_context_window_size', return_value=1000),
+        ]
+        for patcher in self.patchers:
+            patcher.start()
+
+    def tearDown(self):
+        for patcher in self.patchers:
+            patcher.stop()
+        Agent._llm_provider_cache.clear()
+        shutil.rmtree(self.memory_dir)
+
+    def create_agent(self, api_key):
+        config = Config(
+            default_model_id="fake-model",
+            tools_dirs=[],
+            mcp_tools_dirs=[],
+            memory_dir=self.memory_dir,
+            provider_config={"fake": {"api_key": api_key}},
+        )
+        return Agent(config)
+
+    def test_agents_with_equal_provider_config_share_provider(self):
+        first = self.create_agent("key-1")
+        second = self.create_agent("key-1")
+
+        self.assertIs(first.llm_providers[0], second.llm_providers[0])
+
+    def test_agents_with_different_provider_config_do_not_share_provider(self):
+        first = self.create_agent("key-1")
+        second = self.create_agent("key-2")
+
+        self.assertIsNot(first.llm_providers[0], second.llm_providers[0])
+        self.assertEqual(second.llm_providers[0].api_key, "key-2")
+
+    def test_cache_keys_do_not_contain_config_values(self):
+        self.create_agent("secret-key")
+
+        self.assertNotIn("secret-key", repr(list(Agent._llm_provider_cache)))
+
+    def test_cache_is_bounded(self):
+        with patch.object(Agent, '_LLM_PROVIDER_CACHE_MAX_SIZE', 2):
+            for i in range(3):
+                self.create_agent(f"key-{i}")
+
+        self.assertEqual(len(Agent._llm_provider_cache), 2)
+
+
+class TestLLMProviderClassCache(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.providers_dir = os.path.join(self.test_dir, "pkg", "llm_providers")
+        os.makedirs(self.providers_dir)
+        with open(os.path.join(self.providers_dir, "fake_provider.py"), "w") as f:
+            f.write(FAKE_PROVIDER_MODULE)
+
+    def tearDown(self):
+        Agent._llm_provider_classes.clear()
+        Agent._llm_provider_cache.clear()
+        shutil.rmtree(self.test_dir)
+
+    def test_provider_modules_are_loaded_once(self):
+        with patch('importlib.util.spec_from_file_location',
+                   wraps=importlib.util.spec_from_file_location) as spec_from_file:
+            first = Agent.discover_llm_providers(self.providers_dir, {})
+            second = Agent.discover_llm_providers(self.providers_dir, {})
+
+        self.assertEqual(spec_from_file.call_count, 1)
+        self.assertEqual(len(first), 1)
+        self.assertIs(first[0], second[0])
+        self.assertEqual(first[0].models, ["fake-model"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,173 @@
+import asyncio
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from ai_six.object_model import ToolCall
+from ai_six.object_model.tool import Tool, Parameter
+from ai_six.tools.base.mcp_tool import MCPTool
+from ai_six.tests.memory.mock_agent import create_mock_agent, cleanup_mock_agent
+
+
+class WaitingTool(Tool):
+    """Tool that blocks until the given number of calls are running at the same time."""
+
+    def __init__(self, barrier: threading.Barrier, name="waiting_tool"):
+        super().__init__(
+            name=name,
+            description="Waits for the other calls",
+            parameters=[Parameter(name="value", type="string", description="Value to echo")],
+            required={"value"},
+        )
+        self.barrier = barrier
+
+    def run(self, **kwargs) -> str:
+        self.barrier.wait(timeout=5)
+        return kwargs["value"]
+
+
+class StatefulTool(Tool):
+    """Tool that records how many of its calls overlap and which threads run them."""
+
+    def __init__(self, name="stateful_tool"):
+        super().__init__(
+            name=name,
+            description="Records its calls",
+            parameters=[Parameter(name="value", type="string", description="Value to echo")],
+            required={"value"},
+        )
+        self.lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+        self.threads = []
+
+    def run(self, **kwargs) -> str:
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            self.threads.append(threading.current_thread())
+        time.sleep(0.05)
+        with self.lock:
+            self.active -= 1
+        return kwargs["value"]
+
+
+class CallbackTool(StatefulTool):
+    """Stateful tool with a tool call callback, like AgentTool."""
+
+    def set_tool_call_callback(self, callback):
+        self.callback = callback
+
+
+class TestToolExecution(unittest.TestCase):
+    def setUp(self):
+        self.mock_data = create_mock_agent()
+        self.agent = self.mock_data["agent"]
+
+    def tearDown(self):
+        self.agent.close()
+        cleanup_mock_agent(self.mock_data)
+
+    def make_tool_calls(self, count, name="waiting_tool"):
+        return [
+            ToolCall(id=f"call_{i}", name=name, arguments=f'{{"value": "result {i}"}}', required=["value"])
+            for i in range(count)
+        ]
+
+    def test_sequential_by_default(self):
+        self.agent.tool_dict["waiting_tool"] = WaitingTool(threading.Barrier(1))
+
+        _, tool_messages = self.agent._execute_tools(self.make_tool_calls(3))
+
+        self.assertEqual([m.content for m in tool_messages], ["result 0", "result 1", "result 2"])
+        self.assertIsNone(self.agent._tool_pool)
+
+    def test_concurrent_tool_calls_keep_order(self):
+        # Each tool waits for the other two, so this only finishes if they run concurrently
+        barrier = threading.Barrier(3)
+        for i in range(3):
+            self.agent.tool_dict[f"waiting_tool_{i}"] = WaitingTool(barrier, f"waiting_tool_{i}")
+        self.agent.tool_concurrency = 3
+        tool_calls = [self.make_tool_calls(i + 1, f"waiting_tool_{i}")[i] for i in range(3)]
+
+        updated_tool_calls, tool_messages = self.agent._execute_tools(tool_calls)
+
+        self.assertEqual([m.content for m in tool_messages], ["result 0", "result 1", "result 2"])
+        self.assertEqual(
+            [m.tool_call_id for m in tool_messages],
+            [tool_call.id for tool_call in updated_tool_calls],
+        )
+
+    def test_calls_to_same_tool_run_one_after_another(self):
+        stateful_tool = StatefulTool()
+        self.agent.tool_dict["stateful_tool"] = stateful_tool
+        self.agent.tool_dict["waiting_tool"] = WaitingTool(threading.Barrier(1))
+        self.agent.tool_concurrency = 3
+        tool_calls = self.make_tool_calls(2, "stateful_tool") + self.make_tool_calls(1)
+
+        _, tool_messages = self.agent._execute_tools(tool_calls)
+
+        self.assertEqual([m.content for m in tool_messages], ["result 0", "result 1", "result 0"])
+        self.assertEqual(stateful_tool.max_active, 1)
+
+    def test_callback_and_memory_tools_run_on_calling_thread(self):
+        callback_tool = CallbackTool("callback_tool")
+        self.agent.tool_dict["callback_tool"] = callback_tool
+        self.agent.tool_dict["stateful_tool"] = StatefulTool()
+        self.agent.tool_concurrency = 3
+        tool_calls = (
+            self.make_tool_calls(2, "callback_tool")
+            + self.make_tool_calls(1, "stateful_tool")
+            + [ToolCall(id="call_session", name="get_session_id", arguments="{}", required=[])]
+        )
+
+        _, tool_messages = self.agent._execute_tools(tool_calls)
+
+        self.assertEqual(callback_tool.threads, [threading.current_thread()] * 2)
+        self.assertIn(self.agent.get_session_id(), tool_messages[3].content)
+
+    def test_mcp_tools_share_one_group(self):
+        # MCP tools run on a shared event loop, so overlapping calls would fail with
+        # "This event loop is already running"
+        async def invoke_tool(server_id, tool_name, args):
+            await asyncio.sleep(0.05)
+            return f"{tool_name} ok"
+
+        client = MagicMock()
+        client.is_connected.return_value = True
+        client.invoke_tool = invoke_tool
+        for name in ("list_repos", "get_user"):
+            self.agent.tool_dict[name] = MCPTool("github", "github", {"name": name})
+        self.agent.tool_concurrency = 4
+        tool_calls = [
+            ToolCall(id="call_0", name="list_repos", arguments="{}", required=[]),
+            ToolCall(id="call_1", name="get_user", arguments="{}", required=[]),
+        ]
+
+        loop = asyncio.new_event_loop()
+        try:
+            with patch.object(MCPTool, "_get_client", return_value=client), \
+                    patch.object(MCPTool, "_get_or_create_loop", return_value=loop):
+                _, tool_messages = self.agent._execute_tools(tool_calls)
+        finally:
+            loop.close()
+
+        self.assertEqual([m.content for m in tool_messages], ["list_repos ok", "get_user ok"])
+
+    def test_changing_concurrency_replaces_pool(self):
+        self.agent.tool_dict["waiting_tool"] = WaitingTool(threading.Barrier(1))
+        self.agent.tool_dict["stateful_tool"] = StatefulTool()
+        self.agent.tool_concurrency = 2
+        self.agent._execute_tools(self.make_tool_calls(1) + self.make_tool_calls(1, "stateful_tool"))
+        pool = self.agent._tool_pool
+        self.assertIsNotNone(pool)
+
+        self.agent.tool_concurrency = 1
+
+        self.assertIsNone(self.agent._tool_pool)
+        self.assertTrue(pool._shutdown)
+
+
+if __name__ == "__main__":
+    unittest.main()
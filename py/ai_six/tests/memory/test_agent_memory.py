@@ -2,11 +2,12 @@ import unittest
 import tempfile
 import shutil
 import os
+import json
 from unittest.mock import MagicMock, patch
 
 from ai_six.agent.config import Config
 from ai_six.agent.agent import Agent
-from ai_six.object_model import LLMProvider, ToolCall, AssistantMessage
+from ai_six.object_model import LLMProvider, ToolCall, AssistantMessage, UserMessage
 from ai_six.agent.session import Session
 from ai_six.agent.session_manager import SessionManager
 
@@ -124,7 +125,20 @@ class TestAgentMemory(unittest.TestCase):
         self.assertEqual(self.agent.session.messages[0].content, "Hello")
         self.assertEqual(self.agent.session.messages[1].role, "assistant")
         self.assertEqual(self.agent.session.messages[1].content, "I'll help you with that!")
-        
+
+    def test_send_message_with_available_tool_ids(self):
+        """Test that only the available tools are offered to the LLM."""
+        self.agent.tool_dict["echo"] = MagicMock()
+        self.agent.tool_dict["ls"] = MagicMock()
+
+        with patch.object(self.llm_provider, "send", wraps=self.llm_provider.send) as mock_send:
+            self.agent.send_message("Hello", "mock-model", None, available_tool_ids={"echo"})
+
+        offered_tools = mock_send.call_args.args[1]
+        self.assertEqual(list(offered_tools), ["echo"])
+        # The agent's own tools are left untouched
+        self.assertIn("ls", self.agent.tool_dict)
+
     def test_session_saving(self):
         """Test that sessions are saved correctly."""
         # Set up the mock response
@@ -162,6 +176,52 @@ class TestAgentMemory(unittest.TestCase):
         self.assertEqual(new_agent.session.messages[0].role, "user")
         self.assertEqual(new_agent.session.messages[0].content, "Hello")
         
+    def test_load_session(self):
+        """Test loading a saved session and reloading the active one."""
+        self.llm_provider.add_mock_response("I'll help you with that!")
+        self.agent.send_message("Hello", "mock-model", None)
+        self.agent.session.save()
+        session_id = self.agent.get_session_id()
+
+        with patch('ai_six.agent.agent.Agent.discover_llm_providers', return_value=[self.llm_provider]), \
+             patch('ai_six.agent.tool_manager.get_tool_dict', return_value={}):
+            another_agent = Agent(self.config)
+
+        self.assertTrue(another_agent.load_session(session_id))
+        self.assertEqual(len(another_agent.session.messages), 2)
+        self.assertFalse(another_agent.load_session("nonexistent"))
+
+        # Loading the active session keeps unsaved messages instead of re-reading the file
+        another_agent.session.add_message(UserMessage(content="Unsaved"))
+        with patch.object(another_agent.session, 'load') as mock_load:
+            self.assertTrue(another_agent.load_session(session_id))
+        mock_load.assert_not_called()
+        self.assertEqual(len(another_agent.session.messages), 3)
+
+    def test_load_session_ignores_files_that_are_not_sessions(self):
+        """Test that loading a detailed log file fails without changing the active session."""
+        session_id = self.agent.get_session_id()
+        self.agent.session.add_message(UserMessage(content="Hello"))
+        log_id = f"{session_id}_detailed_log"
+        with open(os.path.join(self.test_dir, f"{log_id}.json"), "w") as f:
+            json.dump(dict(session_id=f"{session_id}-old", messages=[], summary="Summary"), f)
+
+        self.assertFalse(self.agent.load_session(log_id))
+        self.assertEqual(self.agent.get_session_id(), session_id)
+        self.assertEqual(len(self.agent.session.messages), 1)
+
+        # An agent configured with such an id starts with a new session instead of failing
+        config = Config(
+            default_model_id="mock-model",
+            tools_dirs=self.config.tools_dirs,
+            mcp_tools_dirs=self.config.mcp_tools_dirs,
+            memory_dir=self.test_dir,
+            session_id=log_id,
+        )
+        another_agent = Agent(config)
+        self.assertNotEqual(another_agent.get_session_id(), f"{session_id}-old")
+        self.assertEqual(len(another_agent.session.messages), 0)
+
     def test_session_list_and_delete(self):
         """Test listing and deleting sessions."""
         # Set up the mock response
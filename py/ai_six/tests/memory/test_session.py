@@ -3,9 +3,12 @@ import tempfile
 import os
 import json
 import shutil
+import threading
+from unittest.mock import patch
 
+from ai_six.agent import session as session_module
 from ai_six.agent.session import Session
-from ai_six.object_model import Usage, ToolCall, UserMessage, AssistantMessage, ToolMessage
+from ai_six.object_model import Usage, ToolCall, UserMessage, AssistantMessage, ToolMessage, SystemMessage
 
 
 class TestSession(unittest.TestCase):
@@ -16,6 +19,7 @@ class TestSession(unittest.TestCase):
         
     def tearDown(self):
         # Clean up the temporary directory
+        session_module._session_cache.clear()
         shutil.rmtree(self.test_dir)
         
     def test_initialization(self):
@@ -23,6 +27,7 @@ class TestSession(unittest.TestCase):
         self.assertIsNotNone(self.session.session_id)
         self.assertTrue(self.session.title.startswith('Untiled session ~'))
         self.assertEqual(self.session.messages, [])
+        self.assertEqual(self.session.message_count, 0)
         self.assertEqual(self.session.usage.input_tokens, 0)
         self.assertEqual(self.session.usage.output_tokens, 0)
         
@@ -71,6 +76,7 @@ class TestSession(unittest.TestCase):
         self.assertEqual(new_session.session_id, self.session.session_id)
         self.assertEqual(new_session.title, self.session.title)
         self.assertEqual(len(new_session.messages), 2)
+        self.assertEqual(new_session.message_count, 2)
         
         # Verify messages are loaded as Message objects with the right structure
         self.assertIsInstance(new_session.messages[0], UserMessage)
@@ -209,6 +215,7 @@ class TestSession(unittest.TestCase):
         
         # Check that the messages were added
         self.assertEqual(len(self.session.messages), 2)
+        self.assertEqual(self.session.message_count, 2)
         self.assertEqual(self.session.messages[0].role, "user")
         self.assertEqual(self.session.messages[1].role, "assistant")
         
@@ -216,6 +223,46 @@ class TestSession(unittest.TestCase):
         self.assertEqual(self.session.usage.input_tokens, 5)
         self.assertEqual(self.session.usage.output_tokens, 8)
 
+    def test_wait_for_messages(self):
+        """Test waiting for messages added from another thread."""
+        # Times out when nothing arrives
+        self.assertFalse(self.session.wait_for_messages(0, timeout=0.01))
+
+        timer = threading.Timer(0.05, self.session.add_message, args=[SystemMessage(content="A2A Task Update")])
+        timer.start()
+        try:
+            self.assertTrue(self.session.wait_for_messages(0, timeout=5))
+        finally:
+            timer.join()
+        self.assertEqual(len(self.session.messages), 1)
+
+        # Returns immediately if the messages are already there
+        self.assertTrue(self.session.wait_for_messages(0, timeout=0))
+
+    def test_load_reuses_parsed_file_until_saved(self):
+        """Test that an unchanged session file is parsed once across loads."""
+        self.session.add_message(UserMessage(content="Hello AI!"))
+        self.session.save()
+
+        with patch.object(session_module.json, "load", wraps=json.load) as mock_json_load:
+            first = Session(self.test_dir)
+            first.load(self.session.session_id)
+            second = Session(self.test_dir)
+            second.load(self.session.session_id)
+            self.assertEqual(mock_json_load.call_count, 1)
+
+            # Loaded sessions don't share message objects
+            self.assertIsNot(first.messages[0], second.messages[0])
+
+            # Saving changes the file, so the next load sees the new message
+            self.session.add_message(AssistantMessage(content="Hello!"))
+            self.session.save()
+            third = Session(self.test_dir)
+            third.load(self.session.session_id)
+
+        self.assertEqual(mock_json_load.call_count, 2)
+        self.assertEqual(third.message_count, 2)
+
 
 if __name__ == "__main__":
     unittest.main()
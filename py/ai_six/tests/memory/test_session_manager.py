@@ -3,6 +3,7 @@ import tempfile
 import os
 import json
 import shutil
+from unittest.mock import patch
 
 from ai_six.agent.session_manager import SessionManager
 
@@ -50,6 +51,30 @@ class TestSessionManager(unittest.TestCase):
         self.assertEqual(sessions["session2"]["title"], "Test Session 2")
         self.assertEqual(sessions["session3"]["title"], "Test Session 3")
         
+    def test_unchanged_sessions_are_not_reparsed(self):
+        """Test that listing again only re-reads session files that changed."""
+        self.session_manager.list_sessions()
+
+        # Rewriting a session with a longer title changes its signature
+        self.create_test_session("session2", "Renamed Test Session 2")
+        with patch.object(self.session_manager._titles, "parse", wraps=SessionManager._read_title) as mock_read:
+            sessions = self.session_manager.list_sessions()
+
+        mock_read.assert_called_once_with(os.path.join(self.test_dir, "session2.json"))
+        self.assertEqual(sessions["session1"]["title"], "Test Session 1")
+        self.assertEqual(sessions["session2"]["title"], "Renamed Test Session 2")
+
+    def test_set_title(self):
+        """Test that a new title shows up in the next listing."""
+        self.session_manager.list_sessions()
+        self.session_manager.set_title("session1", "New Title")
+        self.assertEqual(self.session_manager.list_sessions()["session1"]["title"], "New Title")
+
+    def test_session_exists(self):
+        """Test checking for a session without listing them all."""
+        self.assertTrue(self.session_manager.session_exists("session1"))
+        self.assertFalse(self.session_manager.session_exists("nonexistent"))
+
     def test_delete_session(self):
         """Test deleting a session."""
         # Delete a session
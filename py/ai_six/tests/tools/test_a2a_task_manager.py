@@ -0,0 +1,31 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from ai_six.a2a_client.a2a_manager import A2AManager
+from ai_six.tools.a2a_task_manager.a2a_task_manager import A2ATaskListTool
+
+
+class TestA2ATaskListTool(unittest.TestCase):
+
+    def setUp(self):
+        self.tool = A2ATaskListTool()
+
+    def test_list_ids_without_message_pump(self):
+        """Test that no task IDs are returned when A2A is not initialized."""
+        with patch.object(A2AManager, "get_message_pump", return_value=None):
+            self.assertEqual(self.tool.list_ids(), set())
+
+    def test_list_ids_returns_active_task_ids(self):
+        """Test that the IDs of all active tasks are returned."""
+        message_pump = MagicMock()
+        message_pump.get_active_tasks.return_value = {
+            "k8s-ai_diagnose_1700000000": MagicMock(),
+            "k8s-ai_status_1700000001": MagicMock(),
+        }
+        with patch.object(A2AManager, "get_message_pump", return_value=message_pump):
+            self.assertEqual(self.tool.list_ids(),
+                             {"k8s-ai_diagnose_1700000000", "k8s-ai_status_1700000001"})
+
+
+if __name__ == "__main__":
+    unittest.main()
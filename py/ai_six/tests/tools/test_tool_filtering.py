@@ -2,8 +2,11 @@ import unittest
 from unittest.mock import MagicMock
 
 from ai_six.agent.config import ToolConfig, Config
-from ai_six.agent.tool_manager import _filter_tools, get_tool_dict
+from ai_six.agent.tool_manager import _filter_tools, get_tool_dict, group_tools_by_server
 from ai_six.object_model.tool import Tool
+from ai_six.tools.base.a2a_tool import A2ATool
+from ai_six.tools.base.mcp_tool import MCPTool
+from a2a.types import AgentSkill
 
 
 class MockTool(Tool):
@@ -210,5 +213,26 @@ class TestConfigValidation(unittest.TestCase):
             self.assertIn("You can only have one of enabled_tools or disabled_tools", str(context.exception))
 
 
+class TestGroupToolsByServer(unittest.TestCase):
+
+    def test_group_tools_by_server(self):
+        """Test that A2A and MCP tools are grouped by server and other tools are skipped."""
+        skill = AgentSkill(id="diagnose", name="diagnose", description="Diagnose", tags=[])
+        tools = [
+            MockTool("echo"),
+            A2ATool("kind-k8s-ai", skill),
+            MCPTool("github", "https://example.com/mcp", {"name": "list_repos"}),
+            A2ATool("other-ai", skill),
+            MCPTool("github", "https://example.com/mcp", {"name": "get_user"}),
+        ]
+        tool_dict = {tool.name: tool for tool in tools}
+
+        self.assertEqual(group_tools_by_server(tool_dict), {
+            "kind-k8s-ai": ["kind-k8s-ai_diagnose"],
+            "github": ["list_repos", "get_user"],
+            "other-ai": ["other-ai_diagnose"],
+        })
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
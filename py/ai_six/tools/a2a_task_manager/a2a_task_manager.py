@@ -1,5 +1,7 @@
 """Specialized A2A task management tools."""
 
+import asyncio
+
 from ai_six.object_model.tool import Tool, Parameter
 from ai_six.a2a_client.a2a_manager import A2AManager
 
@@ -41,9 +43,16 @@ class A2ATaskListTool(Tool):
                 result += f"  ⚠️ User input required: {task_info.user_input_prompt}\\n"
             
             result += "\\n"
-        
+
         return result
 
+    def list_ids(self) -> set[str]:
+        """Return the IDs of all active A2A tasks, without rendering the listing."""
+        message_pump = A2AManager.get_message_pump()
+        if not message_pump:
+            return set()
+        return set(message_pump.get_active_tasks())
+
 
 class A2ATaskCancelTool(Tool):
     """Tool to cancel an A2A task."""
@@ -94,8 +103,6 @@ class A2ATaskMessageTool(Tool):
     
     def run(self, task_id: str, message: str, **kwargs) -> str:
         """Send message to the specified A2A task."""
-        import asyncio
-        
         message_pump = A2AManager.get_message_pump()
         if not message_pump:
             return "A2A not initialized."
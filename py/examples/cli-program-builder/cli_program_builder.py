@@ -10,6 +10,8 @@ to create complete command-line applications.
 import sys
 import os
 import argparse
+import concurrent.futures
+import threading
 from pathlib import Path
 
 # Add the backend modules to the path
@@ -20,6 +22,79 @@ sys.path.insert(0, str(py_directory))
 from ai_six.agent.agent import Agent
 from ai_six.agent.config import Config
 
+TITLE = "🔧 Starting Python CLI Program Builder"
+BANNER = f"{TITLE}\n{'=' * len(TITLE)}"
+
+GREETING = """Hello! I'm a project manager specializing in building Python CLI programs. 
+I work with two expert sub-agents:
+- A Python CLI Developer who writes well-structured command-line code
+- A Python Tester who ensures quality and creates comprehensive tests
+
+My scope is exclusively Python CLI programs. If you need web apps, desktop applications, 
+or programs in other languages, I'll need to respectfully decline and suggest you find 
+a specialist for those areas.
+
+What Python CLI program would you like me to help you build today?"""
+
+class _HeldThreadOutput:
+    """Stand-in for sys.stdout/sys.stderr that holds back what one thread writes.
+
+    Other threads write straight through, and fileno()/isatty() come from the
+    wrapped stream, so input() still uses the terminal as usual.
+    """
+
+    def __init__(self, stream, thread_id: int):
+        self.stream = stream
+        self.thread_id = thread_id
+        self.held: list[str] = []
+
+    def write(self, text: str) -> int:
+        if threading.get_ident() == self.thread_id:
+            self.held.append(text)
+            return len(text)
+        return self.stream.write(text)
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+
+class BackgroundAgent:
+    """Builds the Agent on a daemon thread while the user types their first request.
+
+    Construction prints warnings (skipped tools, MCP/A2A discovery errors). They
+    are held back and printed by get(), so they don't land on the prompt line.
+    The thread is a daemon, so quitting before it finishes exits right away
+    instead of waiting for discovery to complete.
+    """
+
+    def __init__(self, config: Config):
+        self._future: concurrent.futures.Future = concurrent.futures.Future()
+        self._thread = threading.Thread(target=self._build, args=(config,), daemon=True)
+        self._outputs = None
+        self._thread.start()
+
+    def _build(self, config: Config):
+        thread_id = threading.get_ident()
+        self._outputs = (_HeldThreadOutput(sys.stdout, thread_id), _HeldThreadOutput(sys.stderr, thread_id))
+        sys.stdout, sys.stderr = self._outputs
+        try:
+            self._future.set_result(Agent(config))
+        except BaseException as e:
+            self._future.set_exception(e)
+
+    def get(self) -> Agent:
+        """Wait for the Agent, printing any output held back while it was built."""
+        try:
+            return self._future.result()
+        finally:
+            if self._outputs is not None:
+                stdout, stderr = self._outputs
+                self._outputs = None
+                sys.stdout, sys.stderr = stdout.stream, stderr.stream
+                sys.stdout.write("".join(stdout.held))
+                sys.stderr.write("".join(stderr.held))
+
+
 def main():
     # Parse command-line arguments
     parser = argparse.ArgumentParser(
@@ -55,27 +130,15 @@ def main():
     for agent_config in config.agents:
         agent_config.system_prompt = inject_output_dir(agent_config.system_prompt, str(output_dir))
     
-    # Initialize the project manager agent (which manages the sub-agents)
-    agent = Agent(config)
+    # Initialize the project manager agent (which manages the sub-agents) in the
+    # background, so tool discovery overlaps with the user typing their first request
+    background_agent = BackgroundAgent(config)
     
     # Start the CLI builder
-    title = "🔧 Starting Python CLI Program Builder"
-    print(title)
-    print("=" * len(title))
+    print(BANNER)
     
     # Send the initial greeting and request
-    greeting = """Hello! I'm a project manager specializing in building Python CLI programs. 
-I work with two expert sub-agents:
-- A Python CLI Developer who writes well-structured command-line code
-- A Python Tester who ensures quality and creates comprehensive tests
-
-My scope is exclusively Python CLI programs. If you need web apps, desktop applications, 
-or programs in other languages, I'll need to respectfully decline and suggest you find 
-a specialist for those areas.
-
-What Python CLI program would you like me to help you build today?"""
-    
-    print("\n" + greeting + "\n")
+    print("\n" + GREETING + "\n")
     
     # Interactive session for building CLI programs
     try:
@@ -89,8 +152,8 @@ What Python CLI program would you like me to help you build today?"""
                 if not user_input.strip():
                     continue
                     
-                # Send the user's request to the project manager
-                response = agent.send_message(user_input)
+                # Send the user's request to the project manager (waits for it to be ready)
+                response = background_agent.get().send_message(user_input)
                 print("\n" + response + "\n")
                 
                 # Allow follow-up questions and refinements
@@ -105,7 +168,7 @@ What Python CLI program would you like me to help you build today?"""
                         elif not follow_up.strip():
                             continue
                         
-                        response = agent.send_message(follow_up)
+                        response = background_agent.get().send_message(follow_up)
                         print("\n" + response + "\n")
                     except KeyboardInterrupt:
                         print("\n\n⏸️  Interrupted. Type 'new' for a new project or 'quit' to exit.")
@@ -1,6 +1,9 @@
 import argparse
+import asyncio
+import functools
+import os
 import sys
-from types import SimpleNamespace
+from dataclasses import dataclass
 
 # Fix engineio packet limit before importing chainlit
 from engineio.payload import Payload
@@ -26,15 +29,13 @@ def parse_args():
     
     # Preserve our arguments for potential module reloads
     preserved_args = []
-    if any('--streaming-mode' in arg for arg in sys.argv):
-        # Find the original streaming-mode argument and preserve it
-        for i, arg in enumerate(sys.argv):
-            if arg.startswith('--streaming-mode'):
-                if '=' in arg:
-                    preserved_args.append(arg)
-                elif i + 1 < len(sys.argv):
-                    preserved_args.extend([arg, sys.argv[i + 1]])
-                break
+    for i, arg in enumerate(sys.argv):
+        if arg.startswith('--streaming-mode'):
+            if '=' in arg:
+                preserved_args.append(arg)
+            elif i + 1 < len(sys.argv):
+                preserved_args.extend([arg, sys.argv[i + 1]])
+            break
     
     # Put back both unknown args and our preserved args so chainlit can process unknown ones
     sys.argv[1:] = unknown + preserved_args
@@ -52,16 +53,82 @@ config_path = str((script_dir / "config.yaml").resolve())
 # Environment variables will be automatically interpolated by Config.from_file
 agent, agent_config = agent_utils.create_from_config(config_path)
 
-app_config = SimpleNamespace(
+
+@dataclass(slots=True)
+class AppConfig:
+    selected_model: str
+    available_models: list[str]
+    selected_index: int  # position of selected_model in available_models
+    enabled_tools: dict[str, bool]
+    use_streaming: bool
+    enabled_tool_ids: frozenset[str] = frozenset()  # kept in sync with enabled_tools by on_settings_update
+
+
+def model_index(models: list[str], model: str) -> int:
+    """Position of model in models, or 0 if it isn't listed."""
+    try:
+        return models.index(model)
+    except ValueError:
+        return 0
+
+
+available_models = list(agent.model_provider_map.keys())
+app_config = AppConfig(
     selected_model=agent.default_model_id,
-    available_models=list(agent.model_provider_map.keys()),
+    available_models=available_models,
+    selected_index=model_index(available_models, agent.default_model_id),
     enabled_tools={tool: True for tool in agent.tool_dict},
     use_streaming=cli_args.streaming_mode,
+    enabled_tool_ids=frozenset(agent.tool_dict),
 )
 
 
 TOOL_PREFIX = "tool:"
 
+# Streamed chunks arriving within this window (seconds) are sent as one token.
+# Override with AI6_STREAM_FLUSH_INTERVAL; 0 sends chunks as soon as they arrive.
+STREAM_FLUSH_INTERVAL = float(os.environ.get("AI6_STREAM_FLUSH_INTERVAL", "0.025"))
+
+# Set AI6_ASYNC_DEBUG=1 to run the event loop in debug mode, which logs a warning
+# (via the "asyncio" logger) for every callback that blocks it for longer than this
+SLOW_CALLBACK_DURATION = 0.1
+
+# The agent and its session are shared by every chat, so only one message is
+# processed at a time. Waiting on this lock doesn't block the event loop.
+agent_lock = asyncio.Lock()
+
+
+async def run_agent(func, *args, **kwargs):
+    """Run an agent call in a worker thread while holding agent_lock.
+
+    Cancelling the handler (e.g. Chainlit's Stop button) can't stop the thread,
+    so the lock is released when the thread finishes rather than when the
+    awaiting task is cancelled. Otherwise the next message would start a second
+    thread on the same agent and session.
+    """
+    await agent_lock.acquire()
+    work = asyncio.ensure_future(asyncio.to_thread(func, *args, **kwargs))
+
+    def release(future):
+        agent_lock.release()
+        # Retrieve the result so an exception nobody awaits isn't logged as unhandled
+        if not future.cancelled():
+            future.exception()
+
+    work.add_done_callback(release)
+    return await asyncio.shield(work)
+
+
+# The set of tools is fixed, so the switches are built once and only their initial values change
+tool_switches = {
+    tool_name: cl.input_widget.Switch(
+        id=f"{TOOL_PREFIX}{tool_name}",
+        label=f"Tool: {tool_name}",
+        initial=True,
+    )
+    for tool_name in app_config.enabled_tools
+}
+
 
 async def setup_settings():
     model_select = cl.input_widget.Select(
@@ -69,31 +136,37 @@ async def setup_settings():
         label="LLM Model",
         values=app_config.available_models,
         initial_value=app_config.selected_model,
-        initial_index=app_config.available_models.index(app_config.selected_model),
+        initial_index=app_config.selected_index,
     )
-    tool_switches = [
-        cl.input_widget.Switch(
-            id=f"{TOOL_PREFIX}{tool_name}",
-            label=f"Tool: {tool_name}",
-            initial=tool_value,
-        )
-        for tool_name, tool_value in app_config.enabled_tools.items()
-    ]
+    for tool_name, tool_switch in tool_switches.items():
+        tool_switch.initial = app_config.enabled_tools[tool_name]
 
-    await cl.ChatSettings([model_select] + tool_switches).send()
+    await cl.ChatSettings([model_select, *tool_switches.values()]).send()
 
 
 @cl.on_settings_update
 async def on_settings_update(new_settings):
     app_config.selected_model = new_settings["model"]
+    app_config.selected_index = model_index(app_config.available_models, app_config.selected_model)
     for k, v in new_settings.items():
         if k.startswith(TOOL_PREFIX):
             tool_name = k.replace(TOOL_PREFIX, "")
             app_config.enabled_tools[tool_name] = v
+    app_config.enabled_tool_ids = frozenset(k for k, v in app_config.enabled_tools.items() if v)
+
+
+def enable_async_debug():
+    loop = asyncio.get_running_loop()
+    if loop.get_debug():
+        return
+    loop.slow_callback_duration = SLOW_CALLBACK_DURATION
+    loop.set_debug(True)
 
 
 @cl.on_chat_start
 async def on_chat_start():
+    if os.environ.get("AI6_ASYNC_DEBUG") == "1":
+        enable_async_debug()
     await setup_settings()
     streaming_status = "streaming" if app_config.use_streaming else "non-streaming"
     await cl.Message(content=f"AI-6 is ready ({streaming_status} mode). Let's go 🚀!").send()
@@ -102,54 +175,79 @@ async def on_chat_start():
 @cl.on_message
 async def on_message(message: cl.Message):
     """Process user messages and generate responses."""
-    enabled_tool_ids = [k for k, v in app_config.enabled_tools.items() if v]
-    
+    enabled_tool_ids = app_config.enabled_tool_ids
+
     if app_config.use_streaming:
-        # Streaming mode
+        # Streaming mode. The message isn't sent up front: the first stream_token
+        # starts it on the client and send() finalizes it once streaming ends.
         msg = cl.Message(content="")
-        await msg.send()
-
-        # Define a callback function to handle streaming chunks
-        async def on_chunk(chunk: str):
-            # Use the Chainlit built-in streaming method
-            await msg.stream_token(chunk)
 
-        # Stream the response
+        loop = asyncio.get_running_loop()
+        chunks = asyncio.Queue()  # None marks the end of the stream
+
+        # Called with each chunk from the worker thread running the agent
+        on_chunk = functools.partial(loop.call_soon_threadsafe, chunks.put_nowait)
+
+        # Coalesce chunks so a long response isn't sent as one websocket frame per token
+        async def stream_chunks():
+            while True:
+                batch = [await chunks.get()]
+                await asyncio.sleep(STREAM_FLUSH_INTERVAL)
+                while not chunks.empty():
+                    batch.append(chunks.get_nowait())
+                done = batch[-1] is None
+                if done:
+                    batch.pop()
+                if batch:
+                    await msg.stream_token("".join(batch))
+                if done:
+                    return
+
+        # Stream the response off the event loop so other chats stay responsive
         try:
-            agent.stream_message(
-                message.content,
-                app_config.selected_model,
-                on_chunk_func=lambda chunk: cl.run_sync(on_chunk(chunk)),
-                available_tool_ids=enabled_tool_ids,
-            )
-            # Mark the message as complete
-            await msg.update()
+            streamer = asyncio.create_task(stream_chunks())
+            completed = False
+            try:
+                await run_agent(
+                    agent.stream_message,
+                    message.content,
+                    app_config.selected_model,
+                    on_chunk_func=on_chunk,
+                    available_tool_ids=enabled_tool_ids,
+                )
+                completed = True
+            finally:
+                # Chunks scheduled by the worker are queued ahead of the end marker
+                chunks.put_nowait(None)
+                await streamer
+                # Mark the message as complete. If the agent failed partway through,
+                # finalize what was streamed so far so it isn't lost
+                if completed or msg.content:
+                    await msg.send()
         except Exception as e:
             await cl.Message(content=f"Error: {str(e)}").send()
     else:
         # Non-streaming mode
         try:
-            # Temporarily filter tools in the agent for non-streaming
-            original_tool_dict = agent.tool_dict
-            if enabled_tool_ids:
-                agent.tool_dict = {
-                    k: v for k, v in agent.tool_dict.items() if k in enabled_tool_ids
-                }
-            
-            response = agent.send_message(
+            response = await run_agent(
+                agent.send_message,
                 message.content,
                 app_config.selected_model,
                 None,  # on_tool_call_func
+                available_tool_ids=enabled_tool_ids,
             )
             await cl.Message(content=response).send()
-            
         except Exception as e:
             await cl.Message(content=f"Error: {str(e)}").send()
-        finally:
-            # Restore original tool dict
-            agent.tool_dict = original_tool_dict
 
 
 if __name__ == "__main__":
+    # run_chainlit serves with asyncio.run, so this makes it use uvloop where available (not on Windows)
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
     target = str(script_dir / "app.py")
     run_chainlit(target)
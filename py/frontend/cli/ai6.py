@@ -1,12 +1,21 @@
 import os
+import sys
 import argparse
 import pathology.path
 
+from ai_six.agent.session_manager import SessionManager
 from frontend.common import agent_utils
 
 script_dir = pathology.path.Path.script_dir()
 stream_mode = True
 show_tool_calls = False
+verbose = False
+
+# Streamed chunks are buffered and written in batches instead of one write per token
+CHUNK_FLUSH_COUNT = 8
+_out_buf = []
+
+TOOL_CALL_HEADER = "\n🤖 [AI-6 tool call]: "
 
 def get_user_input():
     user_input = input("👤 [You]: ")
@@ -18,13 +27,23 @@ def handle_response(response):
     print(f"\n[AI-6]: {response}")
     print('----------')
 
+def flush_chunks():
+    if _out_buf:
+        sys.stdout.write(''.join(_out_buf))
+        _out_buf.clear()
+    sys.stdout.flush()
+
 def handle_chunk(chunk):
-    print(chunk, end='', flush=True)
+    _out_buf.append(chunk)
+    if len(_out_buf) >= CHUNK_FLUSH_COUNT or '\n' in chunk:
+        flush_chunks()
 
 def handle_tool_call(name, args, result):
+    # Show the text streamed so far even when tool calls themselves are hidden
+    flush_chunks()
     if not show_tool_calls:
         return
-    print(f"\n🤖 [AI-6 tool call]: {name} {', '.join(args.values()) if args else ''}")
+    print(f"{TOOL_CALL_HEADER}{name} {', '.join(map(str, args.values())) if args else ''}")
     print(result)
     print('\n----------')
 
@@ -38,8 +57,13 @@ def main():
                         help='Path to config file (default: config.yaml)')
     parser.add_argument('--env', '-e', type=str,
                         help='Path to .env file for environment variables')
+    parser.add_argument('--verbose', '-v', action='store_true',
+                        help='Print diagnostic messages')
     args = parser.parse_args()
 
+    global verbose
+    verbose = args.verbose
+
     # Load configuration from JSON file
     config_path = args.config
     
@@ -50,7 +74,22 @@ def main():
         possible_env_path = os.path.join(script_dir, ".env")
         if os.path.exists(possible_env_path):
             env_file_path = possible_env_path
-            print(f"Using .env file from {env_file_path}")
+            if verbose:
+                print(f"Using .env file from {env_file_path}")
+
+    # Handle --list argument (listing sessions doesn't need an agent)
+    if args.list:
+        try:
+            config = agent_utils.load_config(config_path, env_file_path=env_file_path)
+        except ValueError as e:
+            return
+        sessions = SessionManager(config.memory_dir).list_sessions()
+        if sessions:
+            for session_id in sessions:
+                print(f"Session ID: {session_id}, Title: {sessions[session_id]['title']}")
+        else:
+            print("No sessions found.")
+        return
 
     try:
         # Create agent from configuration, optionally loading a session
@@ -62,16 +101,6 @@ def main():
     except ValueError as e:
         return
 
-    # Handle --list argument
-    if args.list:
-        sessions = agent.list_sessions()
-        if sessions:
-            for session_id in sessions:
-                print(f"Session ID: {session_id}, Title: {sessions[session_id]['title']}")
-        else:
-            print("No sessions found.")
-        return
-
     # Print current session ID
 
     # Run the session loop with streaming
@@ -87,6 +116,7 @@ def main():
                     on_chunk_func=handle_chunk,
                     on_tool_call_func=handle_tool_call
                 )
+                flush_chunks()
             else:
                 response = agent.send_message(
                     user_input,
@@ -98,6 +128,8 @@ def main():
 
 
     finally:
+        # Don't lose buffered output if the response was interrupted
+        flush_chunks()
         # Save the session when we're done
         print(f"Session saved with ID: {agent.get_session_id()}")
 
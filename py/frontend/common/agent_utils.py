@@ -6,19 +6,42 @@ across different frontends (CLI, Chainlit, Slack, etc.).
 """
 
 import os
-from pathlib import Path
-from typing import Optional, Tuple
+from typing import Optional, Tuple, TYPE_CHECKING
 from dotenv import load_dotenv
 
 from ai_six.agent.config import Config
-from ai_six.agent.agent import Agent
+
+if TYPE_CHECKING:
+    from ai_six.agent.agent import Agent
+
+
+def load_config(config_path: str, env_file_path: Optional[str] = None) -> Config:
+    """Load a configuration file without creating an Agent.
+    
+    Args:
+        config_path: Path to the configuration file (JSON, YAML, or TOML)
+        env_file_path: Optional path to a .env file to load environment variables from
+        
+    Returns:
+        The loaded Config object. Its memory directory is created if needed.
+    """
+    # Load environment variables from .env file if provided
+    if env_file_path and os.path.exists(env_file_path):
+        load_dotenv(env_file_path)
+    else:
+        load_dotenv()
+
+    # Load the configuration (this also creates the memory directory if needed)
+    config = Config.from_file(config_path)
+
+    return config
 
 
 def create_from_config(
     config_path: str, 
     session_id: Optional[str] = None,
     env_file_path: Optional[str] = None
-) -> Tuple[Agent, Config]:
+) -> Tuple["Agent", Config]:
     """Create an Agent instance from a configuration file.
     
     Args:
@@ -30,21 +53,14 @@ def create_from_config(
         A tuple containing (agent, config) where agent is the initialized
         Agent instance and config is the loaded Config object.
     """
-    # Load environment variables from .env file if provided
-    if env_file_path and os.path.exists(env_file_path):
-        load_dotenv(env_file_path)
-    else:
-        load_dotenv()
+    # Imported here so callers that only need the config (e.g. listing sessions)
+    # don't pay for importing the LLM provider SDKs
+    from ai_six.agent.agent import Agent
 
-    # Load the configuration
-    config = Config.from_file(config_path)
-    
-    # Create required directories if they don't exist
-    memory_dir = Path(config.memory_dir)
-    memory_dir.mkdir(parents=True, exist_ok=True)
+    config = load_config(config_path, env_file_path)
     
-    # Create the agent from the configuration
-    agent = Agent.from_config_file(config_path)
+    # Create the agent from the already loaded configuration
+    agent = Agent(config)
     
     # Load session if provided
     if session_id:
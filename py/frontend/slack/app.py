@@ -55,6 +55,10 @@ else:
 app_token = os.environ.get("AI6_APP_TOKEN")
 bot_token = os.environ.get("AI6_BOT_TOKEN")
 
+# Maximum number of tool calls from one LLM response that an agent runs concurrently.
+# The default of 1 runs them one after another.
+TOOL_CONCURRENCY_LIMIT = int(os.environ.get("AI6_TOOL_CONCURRENCY", "1"))
+
 # Initializes your AI-6 app with your bot token and socket mode handler
 app = App(token=bot_token)
 bot_user_id = app.client.auth_test()["user_id"]
@@ -78,18 +82,22 @@ def get_or_create_agent(channel_id):
             channel_id=channel_id,
             env_file_path=env_file_path
         )
+        agents[channel_id].tool_concurrency = TOOL_CONCURRENCY_LIMIT
 
     return agents[channel_id]
 
 
-def handle_tool_call(client, channel, name, args, result):
-    """Handle a tool call from the AI-6 agent."""
+def handle_tool_call(client, channel, thread_ts, name, args, result):
+    """Handle a tool call from the AI-6 agent.
+
+    May be called from the agent's tool threads, so it only uses its arguments.
+    """
     # Post the tool call result as a message
     try:
         client.chat_postMessage(
             channel=channel,
-            thread_ts=latest_ts,
-            text=f"_Tool call: `{name}` {', '.join(args.values()) if args else ''}_\n{result}"
+            thread_ts=thread_ts,
+            text=f"_Tool call: `{name}` {', '.join(map(str, args.values())) if args else ''}_\n{result}"
         )
     except SlackApiError as e:
         print(f"Error posting tool call result: {e}")
@@ -116,9 +124,6 @@ def handle_message(message, say, ack, client):
 
     agent = get_or_create_agent(channel_id)
     
-    # Create a tool call handler for this channel
-    channel_tool_call_handler = partial(handle_tool_call, client, channel_id)
-    
     # Process the message with the AI-6 agent
     try:
         if cli_args.streaming_mode:
@@ -131,6 +136,9 @@ def handle_message(message, say, ack, client):
         
             latest_ts = result["ts"]
             last_message = ""
+
+            # Tool calls are posted in the thread of the response message
+            channel_tool_call_handler = partial(handle_tool_call, client, channel_id, latest_ts)
         
             # Define a callback function to handle streaming chunks
             def handle_chunk(chunk):
@@ -156,6 +164,7 @@ def handle_message(message, say, ack, client):
             )
         else:
             # Non-streaming mode
+            channel_tool_call_handler = partial(handle_tool_call, client, channel_id, None)
             response = agent.send_message(
                 text,
                 agent.default_model_id, 
@@ -226,6 +235,8 @@ def main():
     except Exception as e:
         print(f"Unhandled exception: {e}")
     finally:
+        for agent in agents.values():
+            agent.close()
         leave_channels(app.client)
 
 
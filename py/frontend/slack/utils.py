@@ -46,7 +46,8 @@ def create_channel_agent(
     # Determine memory directory
     memory_base = Path(base_memory_dir or config.memory_dir)
     channel_memory_dir = memory_base / channel_id
-    channel_memory_dir.mkdir(parents=True, exist_ok=True)
+    if not os.path.isdir(channel_memory_dir):
+        os.makedirs(channel_memory_dir, exist_ok=True)
     
     # Create a channel-specific config file
     file_ext = Path(base_config_path).suffix